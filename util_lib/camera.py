@@ -3,12 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 import numpy as np
-import open3d as o3d
-from scipy.spatial.transform import Rotation
 
+from .point_cloud import PointCloud
 from .types import EulerOrder, ICamera, ICameraParameters, Transform, PointsFilterFunction
 
 
+def as_points_3xn(points: np.ndarray | PointCloud) -> np.ndarray:
+    """Return (3, N) array of points. PointCloud is converted without copy."""
+    if isinstance(points, PointCloud):
+        return points.positions_3xn
+    return points
+
+
 def filter_visible_points(
     points: np.ndarray,
     image_width: int,
@@ -39,6 +45,8 @@ def remove_hidden_points(
         - We intend to smooth the surface formed by the foreground points.
 
     """
+    import open3d as o3d  # noqa: PLC0415
+
     norm = np.linalg.norm(points, axis=0)
     d_max = np.max(norm)
     d_min = np.min(norm)
@@ -91,6 +99,8 @@ class SimplePinholeCamera(ICamera):
         return extrinsic
 
     def get_extrinsic_parameters(self, rotate_order: EulerOrder) -> tuple[np.typing.ArrayLike, np.typing.ArrayLike]:
+        from scipy.spatial.transform import Rotation  # noqa: PLC0415
+
         transform = self.__current_transform.get_matrix()
         extrinsic = np.identity(4)
         extrinsic[:3, :3] = transform[:3, :3].T
@@ -103,14 +113,18 @@ class SimplePinholeCamera(ICamera):
     def get_image_size(self) -> tuple[int, int]:
         return self.__intrinsic_parameters.get_image_size()
 
+    def get_intrinsic_parameters(self) -> ICameraParameters:
+        return self.__intrinsic_parameters
+
     def copy(self) -> ICamera:
         return SimplePinholeCamera(self.__intrinsic_parameters, self.__current_transform.copy())
 
     def world_to_camera(
         self,
-        points: np.ndarray,
+        points: np.ndarray | PointCloud,
         remove_hidden: bool,
     ) -> tuple[np.ndarray, PointsFilterFunction]:
+        points = as_points_3xn(points)
         assert points.shape[0] == 3, f"Invalid shape: {points.shape}"  # noqa: S101
         ext_mat = self.get_extrinsic_matrix()
         k_mat = self.get_intrinsic_matrix()
@@ -193,14 +207,18 @@ class OCamCalibOmniDirectionalCamera(ICamera):
     def get_image_size(self) -> tuple[int, int]:
         return self.__intrinsic_parameters.get_image_size()
 
+    def get_intrinsic_parameters(self) -> ICameraParameters:
+        return self.__intrinsic_parameters
+
     def copy(self) -> ICamera:
         return OCamCalibOmniDirectionalCamera(self.__intrinsic_parameters, self.__current_transform.copy())
 
     def world_to_camera(
         self,
-        points: np.ndarray,
+        points: np.ndarray | PointCloud,
         remove_hidden: bool,
     ) -> tuple[np.ndarray, PointsFilterFunction]:
+        points = as_points_3xn(points)
         assert points.shape[0] == 3, f"Invalid shape: {points.shape}"  # noqa: S101
 
         ext_mat = self.get_extrinsic_matrix()
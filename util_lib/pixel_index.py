@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+    from .point_cloud import PointCloud
+    from .types import ICamera, PointsFilterFunction
+
+
+class PixelIndex:
+    """
+    Reverse lookup index from pixels to projected points.
+
+    Description:
+    -----------
+    - 投影された点を画素ごとのバケットに分け、CSR 形式 (画素ごとの点数とオフセット) で保持する
+    - 問い合わせの結果は投影前の点 (world_to_camera に渡した点) のインデックスで返す
+        - 属性は attribute[indices] のように元の配列から取得できる
+    - 問い合わせの計算量は結果の点数 (と走査する行・画素の数) に比例する
+
+    """
+
+    def __init__(
+        self,
+        points_in_image: np.ndarray,
+        source_indices: np.ndarray,
+        image_size: tuple[int, int],
+    ) -> None:
+        """
+        Build index.
+
+        Arguments:
+        ---------
+        points_in_image: world_to_camera が返す画像座標の点 (2 or 3, M)
+        source_indices: 各点に対応する投影前の点のインデックス (M,)
+        image_size: 画像サイズ (width, height)
+
+        """
+        assert points_in_image.shape[1] == len(source_indices), (  # noqa: S101
+            f"Invalid shape: {points_in_image.shape}, {np.shape(source_indices)}"
+        )
+        width, height = image_size
+        self.__width = width
+        self.__height = height
+
+        # Points on the right or bottom edge are assigned to the last pixel
+        cols = np.clip(np.floor(points_in_image[0]).astype(np.int64), 0, width - 1)
+        rows = np.clip(np.floor(points_in_image[1]).astype(np.int64), 0, height - 1)
+        pixel_ids = rows * width + cols
+
+        counts = np.bincount(pixel_ids, minlength=width * height)
+        self.__offsets = np.zeros(width * height + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.__offsets[1:])
+        self.__indices = np.asarray(source_indices)[np.argsort(pixel_ids, kind="stable")]
+
+    def get_counts(self) -> np.ndarray:
+        """Return number of points in each pixel as (height, width) array."""
+        return np.diff(self.__offsets).reshape(self.__height, self.__width)
+
+    def query_point(self, x: int, y: int) -> np.ndarray:
+        """Return indices of the points projected on the pixel (x, y)."""
+        if not (0 <= x < self.__width and 0 <= y < self.__height):
+            return np.empty(0, dtype=self.__indices.dtype)
+        pixel_id = y * self.__width + x
+        return self.__indices[self.__offsets[pixel_id] : self.__offsets[pixel_id + 1]]
+
+    def query_box(self, x_min: int, y_min: int, x_max: int, y_max: int) -> np.ndarray:
+        """
+        Return indices of the points projected inside the pixel rectangle.
+
+        Description:
+        -----------
+        - x_min <= x <= x_max, y_min <= y <= y_max の画素 (両端を含む) を対象とする
+        - 行ごとに連続した範囲を取り出すため、計算量は行数と結果の点数に比例する
+
+        """
+        x_min, y_min = max(x_min, 0), max(y_min, 0)
+        x_max, y_max = min(x_max, self.__width - 1), min(y_max, self.__height - 1)
+        if x_min > x_max or y_min > y_max:
+            return np.empty(0, dtype=self.__indices.dtype)
+        row_heads = np.arange(y_min, y_max + 1) * self.__width
+        return self.__gather(self.__offsets[row_heads + x_min], self.__offsets[row_heads + x_max + 1])
+
+    def query_mask(self, mask: ArrayLike) -> np.ndarray:
+        """Return indices of the points projected on the pixels where the (height, width) mask is True."""
+        mask = np.asarray(mask, dtype=bool)
+        assert mask.shape == (self.__height, self.__width), f"Invalid shape: {mask.shape}"  # noqa: S101
+        pixel_ids = np.flatnonzero(mask)
+        return self.__gather(self.__offsets[pixel_ids], self.__offsets[pixel_ids + 1])
+
+    def __gather(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        # Concatenate ranges [starts[i], ends[i]) without python loop
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=self.__indices.dtype)
+        range_heads = np.cumsum(lengths) - lengths
+        positions = np.repeat(starts - range_heads, lengths) + np.arange(total)
+        return self.__indices[positions]
+
+
+def world_to_camera_with_pixel_index(
+    camera: ICamera,
+    points: np.ndarray | PointCloud,
+    remove_hidden: bool,
+) -> tuple[np.ndarray, PointsFilterFunction, PixelIndex]:
+    """
+    Return the results of camera.world_to_camera and a pixel index of the projected points.
+
+    Note:
+    ----
+    - PixelIndex の問い合わせ結果は points のインデックス (0 <= i < N) で返る
+
+    """
+    points_in_image, filter_points_func = camera.world_to_camera(points, remove_hidden=remove_hidden)
+    n_points = points.shape[1] if isinstance(points, np.ndarray) else len(points)
+    indices = filter_points_func(np.arange(n_points))
+    return points_in_image, filter_points_func, PixelIndex(points_in_image, indices, camera.get_image_size())
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import open3d as o3d
+    from numpy.typing import ArrayLike
+
+    from .types import PointsFilterFunction
+
+
+class PointCloud:
+    """
+    Structure-of-arrays point cloud backed by NumPy.
+
+    Description:
+    -----------
+    - 位置を (N, 3) の C-contiguous な配列で保持し、任意の名前付き属性を (N, ...) の配列で保持する
+    - ICamera.world_to_camera が要求する (3, N) の配列は positions_3xn でコピーなしに取得できる
+    - Open3D への変換は to_open3d / from_open3d を呼んだときのみ行う
+        - tensor API (o3d.t.geometry.PointCloud) を使う場合はメモリを共有する
+    - 属性を変更するたびに get_version の値が増加する
+
+    """
+
+    def __init__(self, positions: ArrayLike, **attributes: ArrayLike) -> None:
+        self.__positions = np.ascontiguousarray(positions, dtype=np.float64)
+        assert self.__positions.ndim == 2 and self.__positions.shape[1] == 3, (  # noqa: PT018, S101
+            f"Invalid shape: {self.__positions.shape}"
+        )
+        self.__attributes: dict[str, np.ndarray] = {}
+        self.__version = 0
+        for name, value in attributes.items():
+            self.set_attribute(name, value)
+        self.__version = 0
+
+    def __len__(self) -> int:
+        return self.__positions.shape[0]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Return positions as (N, 3) array."""
+        return self.__positions
+
+    @property
+    def positions_3xn(self) -> np.ndarray:
+        """Return positions as (3, N) view without copy."""
+        return self.__positions.T
+
+    @property
+    def attributes(self) -> dict[str, np.ndarray]:
+        return dict(self.__attributes)
+
+    def get_version(self) -> int:
+        """
+        Return modification counter of the point cloud.
+
+        Description:
+        -----------
+        - set_attribute や notify_geometry_changed のたびに増加するカウンタを返す
+        - Scene はこの値を比較して再投影が必要な点群を判定する
+
+        """
+        return self.__version
+
+    def notify_geometry_changed(self) -> None:
+        """
+        Mark the point cloud as modified.
+
+        Description:
+        -----------
+        - positions や get_attribute で取得した配列を直接編集した場合に呼び出すこと
+
+        """
+        self.__version += 1
+
+    def get_attribute(self, name: str) -> np.ndarray:
+        return self.__attributes[name]
+
+    def set_attribute(self, name: str, value: ArrayLike) -> None:
+        array = np.ascontiguousarray(value)
+        assert array.shape[0] == len(self), f"Invalid shape: {array.shape}"  # noqa: S101
+        self.__attributes[name] = array
+        self.__version += 1
+
+    def has_attribute(self, name: str) -> bool:
+        return name in self.__attributes
+
+    def filter(self, filter_points_func: PointsFilterFunction, positions: ArrayLike | None = None) -> PointCloud:
+        """
+        Pick points and all attributes by a filter function returned from ICamera.world_to_camera.
+
+        Arguments:
+        ---------
+        filter_points_func: (N, ...) の配列から残す点を選択する関数
+        positions: 新しい位置 (M, 3)。None の場合は元の位置をフィルタしたものを使う
+
+        """
+        return self.select(filter_points_func(np.arange(len(self))), positions)
+
+    def select(self, indices: np.ndarray, positions: ArrayLike | None = None) -> PointCloud:
+        """
+        Pick points and all attributes by indices.
+
+        Description:
+        -----------
+        - 各属性は np.take で一度だけコピーされる
+
+        Arguments:
+        ---------
+        indices: 残す点のインデックス (M,)
+        positions: 新しい位置 (M, 3)。None の場合は元の位置を indices で選択したものを使う
+
+        """
+        new_positions = np.take(self.__positions, indices, axis=0) if positions is None else positions
+        return PointCloud(
+            new_positions,
+            **{name: np.take(value, indices, axis=0) for name, value in self.__attributes.items()},
+        )
+
+    def to_open3d(self, *, legacy: bool = False) -> o3d.t.geometry.PointCloud | o3d.geometry.PointCloud:
+        """
+        Convert to Open3D's point cloud.
+
+        Description:
+        -----------
+        - legacy=False の場合は o3d.t.geometry.PointCloud を返し、位置と属性の配列はコピーされない
+        - legacy=True の場合は o3d.geometry.PointCloud を返す
+            - 位置と colors, normals 属性のみがコピーされる
+
+        """
+        import open3d as o3d  # noqa: PLC0415
+
+        if legacy:
+            pcd = o3d.geometry.PointCloud()
+            pcd.points = o3d.utility.Vector3dVector(self.__positions)
+            if "colors" in self.__attributes:
+                pcd.colors = o3d.utility.Vector3dVector(self.__attributes["colors"])
+            if "normals" in self.__attributes:
+                pcd.normals = o3d.utility.Vector3dVector(self.__attributes["normals"])
+            return pcd
+
+        pcd = o3d.t.geometry.PointCloud(o3d.core.Tensor.from_numpy(self.__positions))
+        for name, value in self.__attributes.items():
+            pcd.point[name] = o3d.core.Tensor.from_numpy(value)
+        return pcd
+
+    @staticmethod
+    def from_open3d(pcd: o3d.t.geometry.PointCloud | o3d.geometry.PointCloud) -> PointCloud:
+        """
+        Create from Open3D's point cloud.
+
+        Description:
+        -----------
+        - CPU 上の o3d.t.geometry.PointCloud の float64 の属性はメモリを共有する
+        - o3d.geometry.PointCloud の場合は points, colors, normals を読み込む
+
+        """
+        import open3d as o3d  # noqa: PLC0415
+
+        if isinstance(pcd, o3d.t.geometry.PointCloud):
+            tensors = {name: tensor.numpy() for name, tensor in pcd.point.items()}
+            positions = tensors.pop("positions")
+            return PointCloud(positions, **tensors)
+
+        attributes = {}
+        if pcd.has_colors():
+            attributes["colors"] = np.asarray(pcd.colors)
+        if pcd.has_normals():
+            attributes["normals"] = np.asarray(pcd.normals)
+        return PointCloud(np.asarray(pcd.points), **attributes)
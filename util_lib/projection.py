@@ -3,19 +3,23 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-import open3d as o3d
+
+from util_lib.pixel_index import PixelIndex
+from util_lib.point_cloud import PointCloud
 
 if TYPE_CHECKING:
+    import open3d as o3d
+
     from util_lib.types import ICamera
 
 
 def projection_by_camera(
-    pcd: o3d.geometry.PointCloud,
+    pcd: o3d.geometry.PointCloud | PointCloud,
     camera: ICamera,
     *,
     return_with_color: bool = True,
     remove_hidden: bool = False,
-) -> o3d.geometry.PointCloud:
+) -> o3d.geometry.PointCloud | PointCloud:
     """
     ICamera の world_to_camera メソッドを使用して点群を投影するバージョン.
 
@@ -24,14 +28,74 @@ def projection_by_camera(
     カメラモデルによってはカメラ座標から画像座標への変換が単純な行列の積で表せない場合がある。
     ICamera ではワールド座標から画像座標への一般化された変換を world_to_camera で定義する。
 
+    util_lib.point_cloud.PointCloud を渡した場合は Open3D を経由せず PointCloud を返す。
+    return_with_color=True のとき、全ての属性が投影後の点に合わせてフィルタされる。
+
     """
+    projected, _, _ = _project_point_cloud(
+        pcd,
+        camera,
+        return_with_color=return_with_color,
+        remove_hidden=remove_hidden,
+        need_indices=False,
+    )
+    return projected
+
+
+def projection_by_camera_with_pixel_index(
+    pcd: o3d.geometry.PointCloud | PointCloud,
+    camera: ICamera,
+    *,
+    return_with_color: bool = True,
+    remove_hidden: bool = False,
+) -> tuple[o3d.geometry.PointCloud | PointCloud, PixelIndex]:
+    """
+    projection_by_camera の結果と、投影された点の PixelIndex を返す.
+
+    Note:
+    ----
+    PixelIndex の問い合わせ結果は入力点群のインデックスで返る。
+
+    """
+    projected, projected_points, indices = _project_point_cloud(
+        pcd,
+        camera,
+        return_with_color=return_with_color,
+        remove_hidden=remove_hidden,
+        need_indices=True,
+    )
+    return projected, PixelIndex(projected_points, indices, camera.get_image_size())
+
+
+def _project_point_cloud(
+    pcd: o3d.geometry.PointCloud | PointCloud,
+    camera: ICamera,
+    *,
+    return_with_color: bool,
+    remove_hidden: bool,
+    need_indices: bool,
+) -> tuple[o3d.geometry.PointCloud | PointCloud, np.ndarray, np.ndarray | None]:
+    # Indices of the input points picked by the camera are composed only once and shared
+    # by all attributes and the pixel index
+    if isinstance(pcd, PointCloud):
+        projected_points, filter_points_func = camera.world_to_camera(pcd, remove_hidden=remove_hidden)
+        indices = filter_points_func(np.arange(len(pcd))) if return_with_color or need_indices else None
+        if return_with_color:
+            projected = pcd.select(indices, positions=projected_points.T)
+        else:
+            projected = PointCloud(projected_points.T)
+        return projected, projected_points, indices
+
+    import open3d as o3d  # noqa: PLC0415
+
     points = np.asarray(pcd.points).T
     projected_points, filter_points_func = camera.world_to_camera(points, remove_hidden=remove_hidden)
+    indices = filter_points_func(np.arange(points.shape[1])) if return_with_color or need_indices else None
 
     projected_pcd = o3d.geometry.PointCloud()
     projected_pcd.points = o3d.utility.Vector3dVector(projected_points.T)
     if return_with_color:
         projected_pcd.colors = o3d.utility.Vector3dVector(
-            filter_points_func(np.asarray(pcd.colors)),
+            np.take(np.asarray(pcd.colors), indices, axis=0),
         )
-    return projected_pcd
+    return projected_pcd, projected_points, indices
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import weakref
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .point_cloud import PointCloud
+from .transformable_object import TransformableObject
+
+if TYPE_CHECKING:
+    import open3d as o3d
+
+    from .types import ICamera, ICameraParameters
+
+
+class _SceneEntry:
+    def __init__(self, slot: int, source: TransformableObject | o3d.geometry.PointCloud | PointCloud) -> None:
+        self.slot = slot
+        self.source = source
+        self.manual_version = 0
+
+    def get_version(self) -> tuple[int, int]:
+        if isinstance(self.source, (TransformableObject, PointCloud)):
+            return self.source.get_version(), self.manual_version
+        return 0, self.manual_version
+
+    def get_points_and_colors(self) -> tuple[np.ndarray, np.ndarray]:
+        if isinstance(self.source, TransformableObject):
+            mesh = self.source.get_geometry()
+            points = np.asarray(mesh.vertices)
+            colors = np.asarray(mesh.vertex_colors) if mesh.has_vertex_colors() else np.zeros_like(points)
+        elif isinstance(self.source, PointCloud):
+            points = self.source.positions
+            has_colors = self.source.has_attribute("colors")
+            colors = self.source.get_attribute("colors") if has_colors else np.zeros_like(points)
+        else:
+            points = np.asarray(self.source.points)
+            colors = np.asarray(self.source.colors) if self.source.has_colors() else np.zeros_like(points)
+        return points.T, colors
+
+
+def _same_parameters(a: ICameraParameters, b: ICameraParameters) -> bool:
+    # Compare field by field since parameters may hold numpy arrays
+    if type(a) is not type(b):
+        return False
+    return all(
+        np.array_equal(getattr(a, field.name), getattr(b, field.name)) for field in dataclasses.fields(a)
+    )
+
+
+class _CameraCache:
+    def __init__(self) -> None:
+        self.reset(None, None, None)
+
+    def reset(
+        self,
+        extrinsic: np.ndarray | None,
+        image_size: tuple[int, int] | None,
+        intrinsic_parameters: ICameraParameters | None,
+    ) -> None:
+        self.extrinsic = extrinsic
+        self.image_size = image_size
+        self.intrinsic_parameters = intrinsic_parameters
+        self.versions: dict[int, tuple[int, int]] = {}
+        # Merged projected points of all objects sorted by sort_keys (= -depth), so that far points come first
+        self.sort_keys = np.empty(0)
+        self.points = np.empty((0, 3))
+        self.colors = np.empty((0, 3))
+        self.depth = np.empty(0)
+        self.slots = np.empty(0, dtype=np.int64)
+        self.source_indices = np.empty(0, dtype=np.int64)
+        self.output: PointCloud | None = None
+
+    def is_valid_for(self, camera: ICamera) -> bool:
+        return (
+            self.extrinsic is not None
+            and np.array_equal(self.extrinsic, camera.get_extrinsic_matrix())
+            and tuple(self.image_size) == tuple(camera.get_image_size())
+            and _same_parameters(self.intrinsic_parameters, camera.get_intrinsic_parameters())
+        )
+
+
+class Scene:
+    """
+    Container of objects and point clouds projected incrementally to cameras.
+
+    Description:
+    -----------
+    - 登録されたオブジェクト・点群を投影し、マージ済みの結果をカメラごとに保持する
+    - 前回の投影から変換やジオメトリが変更されたものだけを再投影する
+        - 変更されたオブジェクトの点のみを取り除き、整列済みの結果に二分探索で挿入する
+        - シーン全体の再ソートは行わない
+    - 投影結果はカメラからの距離の降順 (奥から手前) に並ぶ
+        - 後ろの点から順に描画すれば手前の点が可視となる
+    - カメラの姿勢・画像サイズ・内部パラメータが変化した場合は、そのカメラの結果を全て再計算する
+
+    Note:
+    ----
+    - remove_hidden=True の場合、隠れ点除去はオブジェクトごとに適用される
+        - オブジェクト間の遮蔽は z-order によって表現される
+
+    """
+
+    def __init__(self, *, remove_hidden: bool = False) -> None:
+        self.__remove_hidden = remove_hidden
+        self.__entries: dict[str, _SceneEntry] = {}
+        self.__next_slot = 0
+        self.__caches: weakref.WeakKeyDictionary[ICamera, _CameraCache] = weakref.WeakKeyDictionary()
+
+    def add_object(self, name: str, obj: TransformableObject) -> None:
+        """Register a TransformableObject. Its vertices are projected."""
+        self.__add(name, obj)
+
+    def add_point_cloud(self, name: str, pcd: o3d.geometry.PointCloud | PointCloud) -> None:
+        """
+        Register a point cloud.
+
+        Description:
+        -----------
+        - PointCloud の変更は get_version により検出される
+        - Open3D の点群はバージョンを持たないため、点や色を編集した場合は mark_dirty を呼び出すこと
+
+        """
+        self.__add(name, pcd)
+
+    def remove(self, name: str) -> None:
+        del self.__entries[name]
+
+    def mark_dirty(self, name: str) -> None:
+        """Force reprojection of the registered Open3D point cloud on the next projection."""
+        self.__entries[name].manual_version += 1
+
+    def names(self) -> list[str]:
+        return list(self.__entries)
+
+    def get_slot(self, name: str) -> int:
+        """Return the id stored in object_slot attribute of the projected points."""
+        return self.__entries[name].slot
+
+    def project(self, camera: ICamera) -> PointCloud:
+        """
+        Project all registered geometries by the camera.
+
+        Description:
+        -----------
+        - 変更のあったオブジェクトのみを camera.world_to_camera で再投影する
+        - 戻り値の点群は画像座標で、奥の点から順に並び、以下の属性を持つ
+            - colors: 点の色
+            - depth: カメラ中心からの距離
+            - object_slot: 点の元のオブジェクトの id (get_slot で取得できる)
+            - source_index: 元のオブジェクトの頂点・点のインデックス
+            - Open3D の点群が必要な場合は to_open3d を呼び出すこと
+        - 変更がなければ前回と同じ点群オブジェクトを返すため、戻り値を直接編集しないこと
+
+        """
+        cache = self.__caches.get(camera)
+        if cache is None:
+            cache = _CameraCache()
+            self.__caches[camera] = cache
+
+        if not cache.is_valid_for(camera):
+            cache.reset(
+                camera.get_extrinsic_matrix(),
+                camera.get_image_size(),
+                copy.deepcopy(camera.get_intrinsic_parameters()),
+            )
+
+        current = {entry.slot: entry for entry in self.__entries.values()}
+        stale = [
+            slot
+            for slot, version in cache.versions.items()
+            if slot not in current or current[slot].get_version() != version
+        ]
+        fresh = [entry for slot, entry in current.items() if cache.versions.get(slot) != entry.get_version()]
+
+        if cache.output is not None and not stale and not fresh:
+            return cache.output
+
+        if stale:
+            self.__drop(cache, stale)
+        if fresh:
+            self.__insert(cache, camera, fresh)
+
+        cache.output = PointCloud(
+            cache.points,
+            colors=cache.colors,
+            depth=cache.depth,
+            object_slot=cache.slots,
+            source_index=cache.source_indices,
+        )
+        return cache.output
+
+    def __add(self, name: str, source: TransformableObject | o3d.geometry.PointCloud | PointCloud) -> None:
+        if name in self.__entries:
+            error_msg = f"Already registered: {name}"
+            raise KeyError(error_msg)
+        self.__entries[name] = _SceneEntry(self.__next_slot, source)
+        self.__next_slot += 1
+
+    @staticmethod
+    def __drop(cache: _CameraCache, slots: list[int]) -> None:
+        keep = ~np.isin(cache.slots, slots)
+        cache.sort_keys = cache.sort_keys[keep]
+        cache.points = cache.points[keep]
+        cache.colors = cache.colors[keep]
+        cache.depth = cache.depth[keep]
+        cache.slots = cache.slots[keep]
+        cache.source_indices = cache.source_indices[keep]
+        for slot in slots:
+            del cache.versions[slot]
+
+    def __insert(self, cache: _CameraCache, camera: ICamera, entries: list[_SceneEntry]) -> None:
+        # Camera center in world coordinate
+        rot, trans = cache.extrinsic[:3, :3], cache.extrinsic[:3, 3]
+        center = -rot.T @ trans
+
+        points, colors, depth, slots, source_indices = [], [], [], [], []
+        for entry in entries:
+            cache.versions[entry.slot] = entry.get_version()
+            world_points, world_colors = entry.get_points_and_colors()
+            if world_points.shape[1] == 0:
+                continue
+            projected, filter_points_func = camera.world_to_camera(world_points, remove_hidden=self.__remove_hidden)
+            indices = filter_points_func(np.arange(world_points.shape[1]))
+            points.append(projected.T)
+            colors.append(np.take(world_colors, indices, axis=0))
+            depth.append(np.linalg.norm(np.take(world_points, indices, axis=1) - center[:, np.newaxis], axis=0))
+            slots.append(np.full(len(indices), entry.slot, dtype=np.int64))
+            source_indices.append(indices)
+
+        if not depth:
+            return
+
+        # Only the new points are sorted, then inserted into the already sorted points
+        new_keys = -np.concatenate(depth)
+        order = np.argsort(new_keys, kind="stable")
+        new_keys = new_keys[order]
+        positions = np.searchsorted(cache.sort_keys, new_keys, side="right")
+
+        cache.sort_keys = np.insert(cache.sort_keys, positions, new_keys)
+        cache.points = np.insert(cache.points, positions, np.concatenate(points)[order], axis=0)
+        cache.colors = np.insert(cache.colors, positions, np.concatenate(colors)[order], axis=0)
+        cache.depth = np.insert(cache.depth, positions, -new_keys)
+        cache.slots = np.insert(cache.slots, positions, np.concatenate(slots)[order])
+        cache.source_indices = np.insert(cache.source_indices, positions, np.concatenate(source_indices)[order])
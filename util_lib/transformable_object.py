@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import copy
+from typing import TYPE_CHECKING
 
 import numpy as np
 import numpy.typing as npt
-import open3d as o3d
-from scipy.spatial.transform import Rotation
 
 from .types import Axis, EulerOrder, Transform
 
+if TYPE_CHECKING:
+    import open3d as o3d
+
 
 class TransformableObject:
     def __init__(
@@ -18,6 +20,7 @@ class TransformableObject:
     ) -> None:
         self.base_model = base_model
         self.__current_transform: Transform = Transform(initial_transform)
+        self.__version = 0
 
     def get_geometry(self) -> o3d.geometry.TriangleMesh:
         """Return raw Open3D's TriangleMesh object."""
@@ -27,6 +30,29 @@ class TransformableObject:
         """Return current transformation."""
         return self.__current_transform
 
+    def get_version(self) -> int:
+        """
+        Return modification counter of the object.
+
+        Description:
+        -----------
+        - 変換やジオメトリの変更のたびに増加するカウンタを返す
+        - Scene はこの値を比較して再投影が必要なオブジェクトを判定する
+
+        """
+        return self.__version
+
+    def notify_geometry_changed(self) -> None:
+        """
+        Mark the geometry as modified.
+
+        Description:
+        -----------
+        - get_geometry で取得したメッシュを直接編集した場合に呼び出すこと
+
+        """
+        self.__version += 1
+
     def copy(self) -> TransformableObject:
         return TransformableObject(copy.deepcopy(self.base_model), copy.deepcopy(self.get_transform().get_matrix()))
 
@@ -49,6 +75,7 @@ class TransformableObject:
         transform = np.identity(4)
         transform[:, 3] = np.array([x, y, z, 1])
         self.__current_transform = Transform(transform) @ self.__current_transform
+        self.__version += 1
 
     def rotate(self, rotate_matrix: npt.ArrayLike[float]) -> None:
         """
@@ -70,6 +97,7 @@ class TransformableObject:
         transform[:3, :3] = rotate_matrix @ self.__current_transform.get_matrix()[:3, :3]
         transform[:3, 3] = self.__current_transform.get_matrix()[:3, 3]
         self.__current_transform = Transform(transform)
+        self.__version += 1
 
     def rotate_by_euler(self, order: EulerOrder, rotation_123: npt.ArrayLike[float], degrees: bool = True) -> None:
         """
@@ -90,6 +118,8 @@ class TransformableObject:
         degrees: 角度の単位が度数法か弧度法かを指定する。Trueなら度数法
 
         """
+        from scipy.spatial.transform import Rotation  # noqa: PLC0415
+
         r1, r2, r3 = rotation_123
         rot = Rotation.from_euler(order, [r1, r2, r3], degrees=degrees).as_matrix()
         self.rotate(rot)
@@ -108,6 +138,8 @@ class TransformableObject:
         quaternion_xyzw: クォータニオンのx, y, z, wの順で指定する (wはスカラー成分)
 
         """
+        from scipy.spatial.transform import Rotation  # noqa: PLC0415
+
         assert np.array(quaternion_xyzw).shape == (4,), f"Invalid shape: {np.array(quaternion_xyzw).shape}"  # noqa: S101
         self.rotate(Rotation.from_quat(quaternion_xyzw).as_matrix())
 
@@ -127,10 +159,13 @@ class TransformableObject:
         """
         self.base_model.transform(transform.get_matrix())
         self.__current_transform = transform @ self.__current_transform
+        self.__version += 1
 
     def mirror(self, axis: Axis) -> None:
         pass
 
     @staticmethod
     def load_model(file_path: str, **kwargs) -> TransformableObject:  # noqa: ANN003
+        import open3d as o3d  # noqa: PLC0415
+
         return TransformableObject(o3d.io.read_triangle_mesh(file_path, **kwargs))
@@ -3,11 +3,14 @@ from __future__ import annotations
 import abc
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 from numpy.typing import ArrayLike
 
+if TYPE_CHECKING:
+    from .point_cloud import PointCloud
+
 
 class Axis(str, Enum):
     X = "X"
@@ -100,6 +103,10 @@ class ICamera(abc.ABC):
     def get_image_size(self) -> tuple[int, int]:
         pass
 
+    @abc.abstractmethod
+    def get_intrinsic_parameters(self) -> ICameraParameters:
+        pass
+
     @abc.abstractmethod
     def transform(self, transform: Transform) -> None:
         pass
@@ -111,7 +118,14 @@ class ICamera(abc.ABC):
     @abc.abstractmethod
     def world_to_camera(
         self,
-        points: np.ndarray,
+        points: np.ndarray | PointCloud,
         remove_hidden: bool,
     ) -> tuple[np.ndarray, PointsFilterFunction]:
-        """Return points in image coordinate and filtering function which picks data corresponding to points."""
+        """
+        Return points in image coordinate and filtering function which picks data corresponding to points.
+
+        Note:
+        ----
+        - points は (3, N) の配列、または PointCloud を受け付ける
+
+        """
@@ -3,11 +3,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-import open3d as o3d
 
 from .transformable_object import TransformableObject
 
 if TYPE_CHECKING:
+    import open3d as o3d
+
     from .types import ICamera
 
 
@@ -24,6 +25,8 @@ def draw_geometries(
     - オブジェクトを見やすいよう背景色を変更している
 
     """
+    import open3d as o3d  # noqa: PLC0415
+
     vis = o3d.visualization.Visualizer()
 
     if camera is not None:
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
-import open3d as o3d
+
+if TYPE_CHECKING:
+    import open3d as o3d
 
 
 def create_coordinate_objects() -> o3d.geometry.TriangleMesh:
     """この関数は、座標軸を表すオブジェクトを生成します."""
+    import open3d as o3d  # noqa: PLC0415
 
     def __create_spheres(xs, ys, zs, color):  # noqa: ANN202, ANN001
         spheres = []